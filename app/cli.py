@@ -1,14 +1,143 @@
 """Command-line interface for the transcription utility."""
 
 import click
+import itertools
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import replace
 from pathlib import Path
-from typing import List
-from app.transcriber import TranscriberFactory, TranscriptionError
-from app.models import TranscriptionOptions
+from typing import List, Optional
+from tqdm import tqdm
+from app.transcriber import BaseTranscriber, TranscriberFactory, TranscriptionError
+from app.models import (
+    TranscriptionOptions,
+    TranscriptionResult,
+    TranscriptionResultStream,
+)
 from app.io_utils import FileUtils, InputValidator
-from app.formats import FormatterFactory
+from app.formats import FormatterFactory, OutputFormatter, shared_render_cache
 from app.config import AppConfig
 
+# Serializes terminal output from worker threads
+_echo_lock = threading.Lock()
+
+
+def _echo(message: str = "", **style) -> None:
+    """Echo a styled message without garbling the progress bar.
+
+    Safe to call from worker threads.
+    """
+    with _echo_lock, tqdm.external_write_mode():
+        click.echo(click.style(message, **style) if style else message)
+
+
+def _error_message(error: Exception) -> str:
+    """Describe a per-source failure for the terminal."""
+    if isinstance(error, TranscriptionError):
+        return f"Transcription failed: {error}"
+    return f"Error: {error}"
+
+
+def _save_outputs(
+    base_name: str,
+    result: TranscriptionResult | TranscriptionResultStream,
+    output_dir: Path,
+    formatters: List[tuple[str, OutputFormatter]],
+) -> List[Path]:
+    """Write every requested format for one result and return the paths."""
+    saved_files = []
+
+    # One timestamp for every format, so md and json agree
+    if result.transcribed_at is None:
+        result.transcribed_at = datetime.now().isoformat()
+
+    with shared_render_cache(result, [fmt for fmt, _ in formatters]):
+        for fmt, formatter in formatters:
+            output_path = FileUtils.generate_output_path(
+                base_name,
+                result.language,
+                fmt,
+                output_dir,
+            )
+            with FileUtils.open_output(output_path) as fh:
+                formatter.write(result, fh)
+            saved_files.append(output_path)
+
+    return saved_files
+
+
+def _process_batch(
+    batch: List[tuple[str, str | Path, str]],
+    options: TranscriptionOptions,
+    transcriber: BaseTranscriber,
+    output_dir: Path,
+    formatters: List[tuple[str, OutputFormatter]],
+) -> List[tuple[str | Path, bool, List[Path], Optional[str], float]]:
+    """Transcribe a batch of sources and save all requested outputs.
+
+    Runs on a worker thread, so it never mutates shared state.
+    ``batch`` holds (source_type, source, base_name) triples, with base
+    names already made unique across the run, and ``formatters`` pairs
+    each requested format name with its formatter.
+
+    Returns:
+        One (source, ok, saved_files, error_message, audio_seconds) tuple
+        per source
+    """
+    for source_type, source, _ in batch:
+        _echo(f"\nProcessing {source_type}: {source}", fg="cyan")
+
+    sources = [source for _, source, _ in batch]
+    base_names = [base_name for _, _, base_name in batch]
+    if len(sources) == 1 and len(formatters) == 1 and formatters[0][1].SUPPORTS_STREAM:
+        # Unbatched, single streamable format: write segments as they
+        # arrive instead of holding the transcript in memory. Larger
+        # batches keep going through transcribe_many.
+        return [
+            _stream_source(
+                sources[0], base_names[0], options, transcriber, output_dir, formatters
+            )
+        ]
+
+    try:
+        results = transcriber.transcribe_many(sources, options)
+    except Exception as e:
+        results = [e] * len(sources)
+
+    outcomes = []
+    for source, base_name, result in zip(sources, base_names, results):
+        if isinstance(result, Exception):
+            outcomes.append((source, False, [], _error_message(result), 0.0))
+            continue
+        try:
+            saved_files = _save_outputs(base_name, result, output_dir, formatters)
+            outcomes.append((source, True, saved_files, None, result.duration))
+        except Exception as e:
+            outcomes.append((source, False, [], _error_message(e), 0.0))
+
+    return outcomes
+
+
+def _stream_source(
+    source: str | Path,
+    base_name: str,
+    options: TranscriptionOptions,
+    transcriber: BaseTranscriber,
+    output_dir: Path,
+    formatters: List[tuple[str, OutputFormatter]],
+) -> tuple[str | Path, bool, List[Path], Optional[str], float]:
+    """Transcribe one source via transcribe_stream and write it directly."""
+    try:
+        stream = transcriber.transcribe_stream(
+            source, replace(options, source=source)
+        )
+        saved_files = _save_outputs(base_name, stream, output_dir, formatters)
+        return (source, True, saved_files, None, stream.duration or 0.0)
+    except Exception as e:
+        return (source, False, [], _error_message(e), 0.0)
+
 
 @click.group()
 def cli():
@@ -65,15 +194,38 @@ def cli():
     default="utterance",
     help="Timestamp granularity",
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help=f"Sources transcribed in parallel (capped at {AppConfig.MAX_BATCH_SIZE})",
+)
+@click.option(
+    "--max-inflight",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Max sources queued or running at once (default: one batch per worker)",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Sources sent to the provider per request, for providers that batch",
+)
 def transcribe(
     url: tuple,
     files: tuple,
     language: str,
     quality: str,
-    output_format: tuple,
+    output_formats: tuple,
     out_dir: str,
     diarization: bool,
     timestamps: str,
+    concurrency: int,
+    max_inflight: Optional[int],
+    batch_size: int,
 ):
     """Transcribe audio/video sources.
 
@@ -90,6 +242,10 @@ def transcribe(
     \b
     # Batch processing
     python main.py transcribe --file file1.mp3 --file file2.wav --out-dir ./transcripts
+
+    \b
+    # Transcribe up to 8 sources at a time
+    python main.py transcribe --file a.mp3 --file b.mp3 --url "https://youtu.be/..." --concurrency 8
     """
 
     if not url and not files:
@@ -97,7 +253,7 @@ def transcribe(
         return
 
     output_dir = Path(out_dir) if out_dir else AppConfig.OUTPUT_DIR
-    output_dir.mkdir(parents=True, exist_ok=True)
+    AppConfig.ensure_dir(output_dir)
 
     # Validate inputs
     valid_urls = []
@@ -126,78 +282,104 @@ def transcribe(
         diarization=diarization,
         smart_format=True,
         timestamps=timestamps,
-        output_formats=list(output_format),
+        output_formats=list(output_formats),
     )
 
     # Create transcriber
     transcriber = TranscriberFactory.create()
 
+    # Formats are the same for every source, so resolve them once
+    formatters = [
+        (fmt, FormatterFactory.get_formatter(fmt)) for fmt in options.output_formats
+    ]
+
     # Process all sources
     all_sources = [("url", u) for u in valid_urls] + [("file", f) for f in valid_files]
+    # Outputs share one directory, so sources with the same base name
+    # (d1/x.mp3 and d2/x.mp3) must not write the same file concurrently
+    base_names = FileUtils.unique_base_names(source for _, source in all_sources)
+    all_sources = [
+        (source_type, source, base_name)
+        for (source_type, source), base_name in zip(all_sources, base_names)
+    ]
     completed = 0
     failed = 0
 
-    with click.progressbar(
-        all_sources,
-        label="Transcribing",
-        show_pos=True,
-    ) as bar:
-        for source_type, source in bar:
-            try:
-                click.echo(
-                    click.style(
-                        f"\nProcessing {source_type}: {source}",
-                        fg="cyan",
-                    )
-                )
+    # Group sources into provider batches (one source each by default)
+    batches = [
+        all_sources[i : i + batch_size] for i in range(0, len(all_sources), batch_size)
+    ]
 
-                # Update options with current source
-                options.source = source
+    # Provider calls are I/O-bound, so threads give near-linear speedup
+    workers = min(concurrency, AppConfig.MAX_BATCH_SIZE, len(batches))
+    # Queue one batch per worker by default so Ctrl-C leaves little to drain
+    inflight_limit = (
+        max(1, max_inflight // batch_size) if max_inflight else workers
+    )
+    queued = iter(batches)
 
-                # Transcribe
-                result = transcriber.transcribe(source, options)
+    # Throughput in seconds of audio per wall-clock second
+    audio_seconds = 0.0
+    started = time.monotonic()
 
-                # Save outputs
-                base_name = FileUtils.extract_base_name(source)
-                saved_files = []
+    with ThreadPoolExecutor(max_workers=workers) as pool, tqdm(
+        total=len(all_sources),
+        desc="Transcribing",
+        unit="file",
+        dynamic_ncols=True,
+        smoothing=0.1,
+        mininterval=0.1,
+    ) as bar:
+        futures = set()
 
-                for fmt in options.output_formats:
-                    formatter = FormatterFactory.get_formatter(fmt)
-                    output = formatter.format(result)
-                    output_path = FileUtils.generate_output_path(
-                        base_name,
-                        result.language,
-                        fmt,
+        def submit(count: int) -> None:
+            for batch in itertools.islice(queued, count):
+                futures.add(
+                    pool.submit(
+                        _process_batch,
+                        batch,
+                        options,
+                        transcriber,
                         output_dir,
-                    )
-                    output_path.write_text(output, encoding="utf-8")
-                    saved_files.append(output_path)
-
-                click.echo(
-                    click.style(
-                        f"  ✓ Saved to:\n    "
-                        + "\n    ".join(str(p.absolute()) for p in saved_files),
-                        fg="green",
+                        formatters,
                     )
                 )
-                completed += 1
 
-            except TranscriptionError as e:
-                click.echo(
-                    click.style(
-                        f"  ✗ Transcription failed: {e}",
-                        fg="red",
-                    )
-                )
-                failed += 1
-            except Exception as e:
-                click.echo(
-                    click.style(
-                        f"  ✗ Error: {e}",
-                        fg="red",
-                    )
-                )
-                failed += 1
+        submit(inflight_limit)
+
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    futures.discard(future)
+
+                    for source, ok, saved_files, error, duration in future.result():
+                        if ok:
+                            _echo(
+                                f"  ✓ {source} saved to:\n    "
+                                + "\n    ".join(
+                                    str(p.absolute()) for p in saved_files
+                                ),
+                                fg="green",
+                            )
+                            completed += 1
+                            audio_seconds += duration
+                        else:
+                            _echo(f"  ✗ {source}: {error}", fg="red")
+                            failed += 1
+
+                        elapsed = max(time.monotonic() - started, 1e-6)
+                        bar.set_postfix(
+                            speed=f"{audio_seconds / elapsed:.1f}x", refresh=False
+                        )
+                        bar.update(1)
+
+                # Keep the queue topped up as batches finish
+                submit(len(done))
+        except KeyboardInterrupt:
+            # Drop queued batches; only the ones already running finish
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
 
     # Summary
     click.echo()
@@ -1,13 +1,16 @@
 """Configuration management for the transcription utility."""
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 import os
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if present
 load_dotenv()
 
+# Directories already created by this process (see AppConfig.ensure_dir)
+_ENSURED_DIRS: Set[Path] = set()
+
 
 class AppConfig:
     """Application configuration."""
@@ -44,6 +47,12 @@ class AppConfig:
     # Max batch size
     MAX_BATCH_SIZE: int = 50
 
+    # Most concurrent GUI jobs selectable (one worker process each): one per
+    # CPU core, but at least 4 since API-backed jobs mostly wait on the network
+    WORKER_PROCESSES: int = int(os.getenv("TRANSCRIBER_WORKER_PROCESSES", "0")) or max(
+        os.cpu_count() or 1, 4
+    )
+
     # Default configuration
     DEFAULTS: Dict = {
         "language": "en",
@@ -57,7 +66,24 @@ class AppConfig:
     @classmethod
     def ensure_output_dir(cls) -> None:
         """Create output directory if it doesn't exist."""
-        cls.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        cls.ensure_dir(cls.OUTPUT_DIR)
+
+    @staticmethod
+    def ensure_dir(path: Path, force: bool = False) -> None:
+        """Create a directory (and parents) at most once per process.
+
+        Later calls for the same path skip the mkdir syscalls, which adds
+        up on network filesystems. Pass ``force`` when the directory may
+        have been deleted since (see FileUtils.open_output).
+        """
+        # Set operations are atomic under the GIL; two threads racing here
+        # at worst both call mkdir, which exist_ok tolerates
+        if force:
+            _ENSURED_DIRS.discard(path)
+        elif path in _ENSURED_DIRS:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
 
 
 # API Configuration (for plugging in real providers)
@@ -78,6 +104,9 @@ class APIConfig:
     # Example: Generic provider configuration
     PROVIDER: str = os.getenv("TRANSCRIBER_PROVIDER", "mock")  # mock | deepgram | whisper | custom
 
+    # Simulated per-job latency of the mock provider, in seconds
+    MOCK_LATENCY: float = float(os.getenv("TRANSCRIBER_MOCK_LATENCY", "0.5"))
+
     @classmethod
     def validate(cls) -> bool:
         """Validate that required API keys are present."""
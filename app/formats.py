@@ -1,39 +1,137 @@
 """Output format handlers for transcripts."""
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import io
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, NamedTuple, TextIO
 import json
+import operator
 from datetime import datetime
-from app.models import TranscriptionResult, Segment
+from app.models import TranscriptionResult, TranscriptionResultStream, Segment
+
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+
+def _hms_ms(seconds: float) -> tuple[int, int, int, int]:
+    """Split seconds into (hours, minutes, seconds, milliseconds)."""
+    hours, rem = divmod(int(seconds * 1000), 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
+    return hours, minutes, secs, millis
 
 
 def seconds_to_srt_time(seconds: float) -> str:
     """Convert seconds to SRT time format (hh:mm:ss,ms)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    hours, minutes, secs, millis = _hms_ms(seconds)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
 def seconds_to_vtt_time(seconds: float) -> str:
     """Convert seconds to VTT time format (hh:mm:ss.ms)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    hours, minutes, secs, millis = _hms_ms(seconds)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
 
+def _srt_time(hms: tuple[int, int, int, int]) -> str:
+    """Format an ``_hms_ms`` tuple as an SRT timestamp."""
+    return "%02d:%02d:%02d,%03d" % hms
+
+
+def _vtt_time(hms: tuple[int, int, int, int]) -> str:
+    """Format an ``_hms_ms`` tuple as a VTT timestamp."""
+    return "%02d:%02d:%02d.%03d" % hms
+
+
+class FormattedSegment(NamedTuple):
+    """Render data for one segment, shared by the subtitle-style formats."""
+
+    segment: Segment
+    start: tuple[int, int, int, int]  # _hms_ms(start_time)
+    end: tuple[int, int, int, int]  # _hms_ms(end_time)
+    wrapped_text: str  # wrapped to 42 chars for subtitle formats
+
+
+def _format_segment(segment: Segment) -> FormattedSegment:
+    """Compute the render data for one segment."""
+    return FormattedSegment(
+        segment,
+        _hms_ms(segment.start_time),
+        _hms_ms(segment.end_time),
+        SRTFormatter._wrap_text(segment.text, max_width=42),
+    )
+
+
+# Formats that read FormattedSegment data, so can share one pre-pass
+_SHARED_RENDER_FORMATS = frozenset({"srt", "vtt", "md"})
+
+
+@contextmanager
+def shared_render_cache(result: TranscriptionResult, formats: Iterable[str]):
+    """Share per-segment render work between formats written in this block.
+
+    The pre-pass only pays off when at least two of srt/vtt/md are
+    written; otherwise each formatter renders on the fly. The cache is
+    dropped on exit so finished results don't keep it alive.
+    """
+    shared = sum(fmt.lower() in _SHARED_RENDER_FORMATS for fmt in formats) >= 2
+    if shared and isinstance(result, TranscriptionResult):
+        result._format_cache = [_format_segment(seg) for seg in result.segments]
+    try:
+        yield
+    finally:
+        if isinstance(result, TranscriptionResult):
+            result._format_cache = None
+
+
+def _formatted_segments(
+    result: TranscriptionResult | TranscriptionResultStream,
+) -> Iterable[FormattedSegment]:
+    """Render data from the shared cache if present, else computed lazily."""
+    cache = getattr(result, "_format_cache", None)
+    if cache is not None:
+        return cache
+    return map(_format_segment, result.segments)
+
+
 class OutputFormatter(ABC):
     """Abstract base for output formatters."""
 
+    # True if write() also accepts a TranscriptionResultStream, consuming
+    # its segments once without needing the duration or segment count first
+    SUPPORTS_STREAM: bool = False
+
     @abstractmethod
     def format(self, result: TranscriptionResult) -> str:
         """Format transcription result."""
         pass
 
+    def write(self, result: TranscriptionResult, fh: TextIO) -> None:
+        """Write formatted result to an open text file.
+
+        Formatters that can render incrementally override this to avoid
+        building the whole output in memory first.
+        """
+        fh.write(self.format(result))
+
+
+class StreamingFormatter(OutputFormatter):
+    """Base for formatters that render incrementally through write()."""
+
+    def format(self, result: TranscriptionResult) -> str:
+        """Render write() output into a single string."""
+        buf = io.StringIO()
+        self.write(result, buf)
+        return buf.getvalue()
+
+    @abstractmethod
+    def write(self, result: TranscriptionResult, fh: TextIO) -> None:
+        """Write formatted result to an open text file."""
+        pass
+
 
 class PlainTextFormatter(OutputFormatter):
     """Plain text output (transcript only)."""
@@ -43,69 +141,75 @@ class PlainTextFormatter(OutputFormatter):
         return result.text
 
 
-class MarkdownFormatter(OutputFormatter):
+class MarkdownFormatter(StreamingFormatter):
     """Markdown output with metadata."""
 
-    def format(self, result: TranscriptionResult) -> str:
-        """Format as Markdown with metadata header."""
-        lines = []
-        lines.append("# Transcript")
-        lines.append("")
-        lines.append(
-            f"**Language:** {result.language} | **Duration:** {result.duration:.1f}s | **Transcribed:** {datetime.now().isoformat()}"
+    def write(self, result: TranscriptionResult, fh: TextIO) -> None:
+        """Write Markdown with metadata header, one segment at a time."""
+        transcribed_at = result.transcribed_at or datetime.now().isoformat()
+        fh.write(
+            "# Transcript\n\n"
+            f"**Language:** {result.language} | **Duration:** {result.duration:.1f}s | **Transcribed:** {transcribed_at}\n\n"
+            "---\n"
         )
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Add segments with timestamps
-        for segment in result.segments:
-            start = seconds_to_srt_time(segment.start_time)
-            end = seconds_to_srt_time(segment.end_time)
+        cache = result._format_cache
+        if cache is not None:
+            times = ((fs.segment, fs.start, fs.end) for fs in cache)
+        else:
+            # No wrapping needed here, so skip the full render pass
+            times = (
+                (seg, _hms_ms(seg.start_time), _hms_ms(seg.end_time))
+                for seg in result.segments
+            )
+        for segment, start, end in times:
             speaker = f" ({segment.speaker})" if segment.speaker else ""
-            lines.append(f"**[{start} - {end}]** {segment.text}{speaker}")
-            lines.append("")
-
-        return "\n".join(lines)
+            fh.write(
+                f"\n**[{_srt_time(start)} - {_srt_time(end)}]** {segment.text}{speaker}\n"
+            )
 
 
-class SRTFormatter(OutputFormatter):
+class SRTFormatter(StreamingFormatter):
     """SRT (SubRip) subtitle format."""
 
-    def format(self, result: TranscriptionResult) -> str:
-        """Format as SRT with proper line breaks and numbering."""
-        lines = []
-        for idx, segment in enumerate(result.segments, 1):
-            start = seconds_to_srt_time(segment.start_time)
-            end = seconds_to_srt_time(segment.end_time)
-
-            # Split text to max ~42 chars per line for readability
-            text = self._wrap_text(segment.text, max_width=42)
-
-            lines.append(str(idx))
-            lines.append(f"{start} --> {end}")
-            lines.append(text)
-            lines.append("")
-
-        return "\n".join(lines).strip()
+    SUPPORTS_STREAM = True
+
+    def write(
+        self, result: TranscriptionResult | TranscriptionResultStream, fh: TextIO
+    ) -> None:
+        """Write SRT with proper line breaks and numbering, one cue at a time."""
+        # Text is pre-wrapped to max ~42 chars per line for readability
+        separator = ""
+        for idx, fs in enumerate(_formatted_segments(result), 1):
+            fh.write(
+                f"{separator}{idx}\n{_srt_time(fs.start)} --> {_srt_time(fs.end)}\n"
+                f"{fs.wrapped_text}"
+            )
+            separator = "\n\n"
 
     @staticmethod
     def _wrap_text(text: str, max_width: int = 42) -> str:
-        """Wrap text to max width, breaking on word boundaries."""
-        words = text.split()
+        """Wrap text to max width, breaking on word boundaries.
+
+        Tracks the running line length instead of re-joining the line for
+        every word.
+        """
+        # Most segments already fit on one line; just normalize whitespace
+        if len(text) <= max_width:
+            return " ".join(text.split())
+
         lines = []
         current_line = []
-
-        for word in words:
-            current_line.append(word)
-            if len(" ".join(current_line)) > max_width:
-                if len(current_line) > 1:
-                    current_line.pop()  # Remove last word
-                    lines.append(" ".join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-                    current_line = []
+        current_len = 0
+
+        for word in text.split():
+            added = len(word) + (1 if current_line else 0)
+            if current_line and current_len + added > max_width:
+                lines.append(" ".join(current_line))
+                current_line = [word]
+                current_len = len(word)
+            else:
+                current_line.append(word)
+                current_len += added
 
         if current_line:
             lines.append(" ".join(current_line))
@@ -113,25 +217,28 @@ class SRTFormatter(OutputFormatter):
         return "\n".join(lines)
 
 
-class VTTFormatter(OutputFormatter):
+class VTTFormatter(StreamingFormatter):
     """WebVTT subtitle format."""
 
-    def format(self, result: TranscriptionResult) -> str:
-        """Format as WebVTT."""
-        lines = ["WEBVTT", ""]
-
-        for segment in result.segments:
-            start = seconds_to_vtt_time(segment.start_time)
-            end = seconds_to_vtt_time(segment.end_time)
+    SUPPORTS_STREAM = True
 
-            # Wrap text similar to SRT
-            text = SRTFormatter._wrap_text(segment.text, max_width=42)
+    def write(
+        self, result: TranscriptionResult | TranscriptionResultStream, fh: TextIO
+    ) -> None:
+        """Write WebVTT, one cue at a time."""
+        fh.write("WEBVTT")
+        # Text is wrapped the same way as SRT
+        for fs in _formatted_segments(result):
+            fh.write(
+                f"\n\n{_vtt_time(fs.start)} --> {_vtt_time(fs.end)}\n{fs.wrapped_text}"
+            )
 
-            lines.append(f"{start} --> {end}")
-            lines.append(text)
-            lines.append("")
 
-        return "\n".join(lines).strip()
+# JSON keys and the Segment attributes they come from, in output order
+_SEGMENT_KEYS = ("start", "end", "text", "speaker", "confidence")
+_segment_fields = operator.attrgetter(
+    "start_time", "end_time", "text", "speaker", "confidence"
+)
 
 
 class JSONFormatter(OutputFormatter):
@@ -143,23 +250,24 @@ class JSONFormatter(OutputFormatter):
             "metadata": {
                 "language": result.language,
                 "duration": result.duration,
-                "transcribed_at": datetime.now().isoformat(),
+                "transcribed_at": result.transcribed_at or datetime.now().isoformat(),
                 "segment_count": len(result.segments),
             },
             "transcript": result.text,
             "segments": [
-                {
-                    "start": segment.start_time,
-                    "end": segment.end_time,
-                    "text": segment.text,
-                    "speaker": segment.speaker,
-                    "confidence": segment.confidence,
-                }
+                dict(zip(_SEGMENT_KEYS, _segment_fields(segment)))
                 for segment in result.segments
             ],
         }
         if result.raw_response:
             data["raw_api_response"] = result.raw_response
+        # orjson gives equivalent JSON, not byte-identical text: floats are
+        # spelled differently (1e-7 vs 1e-07, 1e20 vs 1e+20), NaN becomes
+        # null, and datetimes in raw_response are encoded rather than rejected
+        if orjson is not None:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
         return json.dumps(data, indent=2, ensure_ascii=False)
 
 
@@ -176,7 +284,15 @@ class FormatterFactory:
 
     @classmethod
     def get_formatter(cls, format_name: str) -> OutputFormatter:
-        """Get formatter by name."""
+        """Get formatter by name.
+
+        Names are normally already lowercase (the CLI and GUI only pass
+        lowercase keys), so try an exact lookup before case-folding.
+        """
+        try:
+            return cls.FORMATTERS[format_name]
+        except KeyError:
+            pass
         formatter = cls.FORMATTERS.get(format_name.lower())
         if not formatter:
             raise ValueError(f"Unknown format: {format_name}")
@@ -2,13 +2,26 @@
 
 import PySimpleGUI as sg
 from pathlib import Path
-from typing import List, Optional, Dict, Callable
+from typing import List, Optional, Dict, Callable, Deque
+import asyncio
+import itertools
+import multiprocessing
 import threading
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
 from datetime import datetime
-from app.models import TranscriptionJob, TranscriptionOptions, JobStatus, QualityPreset
+from app.models import (
+    TranscriptionJob,
+    TranscriptionOptions,
+    TranscriptionResult,
+    JobStatus,
+    QualityPreset,
+)
 from app.io_utils import FileUtils, InputValidator
-from app.transcriber import TranscriberFactory, TranscriptionError
-from app.formats import FormatterFactory
+from app.transcriber import TranscriptionError, transcribe_source
+from app.formats import FormatterFactory, shared_render_cache
 from app.config import AppConfig
 
 # Set PySimpleGUI theme
@@ -21,14 +34,39 @@ class TranscriptionGUI:
     def __init__(self):
         """Initialize the GUI."""
         self.jobs: List[TranscriptionJob] = []
-        self.current_job_index: Optional[int] = None
         self.running = False
         self.cancel_requested = False
         self.output_dir = AppConfig.OUTPUT_DIR
-        self.status_log: List[str] = []
-
-        # Create transcriber
-        self.transcriber = TranscriberFactory.create()
+        self.status_log: Deque[str] = deque(maxlen=20)
+        # Last 8 log lines as shown in the status box, rebuilt only on new messages
+        self._log_tail: Deque[str] = deque(maxlen=8)
+        self._log_tail_str = ""
+        self._log_lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+
+        # Jobs per status, kept in step with every status change
+        self._status_counts: Counter = Counter()
+        self._status_lock = threading.Lock()
+        self._last_status_str: Optional[str] = None
+
+        # Rows whose job changed since the table was last drawn, and the
+        # table row of each job id as of the last full redraw
+        self._dirty_rows: set[str] = set()
+        self._row_index: Dict[str, int] = {}
+
+        # Event loop, tasks and slot semaphore of the active run (owned by
+        # the worker thread)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Dict[asyncio.Task, TranscriptionJob] = {}
+        self._sem: Optional[asyncio.Semaphore] = None
+
+        # Transcription runs in worker processes that outlive a single run,
+        # so CPU-bound providers scale across cores and keep loaded models.
+        # Sized to the selected concurrency; created on the first Start.
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_size = 0
+        # Set once the window is closed; workers stop touching it from then
+        self._closed = False
         AppConfig.ensure_output_dir()
 
     def run(self) -> None:
@@ -36,11 +74,17 @@ class TranscriptionGUI:
         window = self._create_window()
 
         while True:
-            event, values = window.read(timeout=100)
+            # Block until something happens; workers post -PROGRESS- events
+            event, values = window.read()
 
             if event == sg.WINDOW_CLOSED or event == "Exit":
                 break
 
+            if event == "-PROGRESS-":
+                self._update_dirty_rows(window)
+                self._update_status_display(window)
+                continue
+
             # Route events
             if event == "-ADD-URLS-":
                 self._handle_add_urls(window, values)
@@ -59,7 +103,11 @@ class TranscriptionGUI:
             self._update_job_table(window)
             self._update_status_display(window)
 
+        self._closed = True
+        self._handle_cancel()
         window.close()
+        if self._pool is not None:
+            self._terminate_pool(self._pool)
 
     def _create_window(self) -> sg.Window:
         """Create the main GUI window."""
@@ -118,6 +166,16 @@ class TranscriptionGUI:
                     [
                         [sg.Checkbox("Smart Formatting", default=True, key="-SMART-FORMAT-")],
                         [sg.Checkbox("Speaker Diarization", default=False, key="-DIARIZATION-")],
+                        [
+                            sg.Text("Concurrent Jobs:"),
+                            sg.Spin(
+                                list(range(1, AppConfig.WORKER_PROCESSES + 1)),
+                                initial_value=min(4, AppConfig.WORKER_PROCESSES),
+                                key="-CONCURRENCY-",
+                                readonly=True,
+                                size=(4, 1),
+                            ),
+                        ],
                     ],
                     vertical_alignment="top",
                 ),
@@ -183,18 +241,20 @@ class TranscriptionGUI:
         if errors:
             sg.popup_error("\n".join(errors))
 
-        for url in valid_urls:
-            base_name = FileUtils.extract_base_name(url)
-            options = self._get_options_from_window(window)
-            options.source = url
+        # One read of the option widgets; each job gets its own copy
+        template = self._get_options_from_window(values)
+        for url, output_name in zip(valid_urls, self._output_names(valid_urls)):
             job = TranscriptionJob(
-                id=f"url-{len(self.jobs)}",
+                id=f"url-{next(self._job_ids)}",
                 source=url,
-                options=options,
+                options=replace(template, source=url),
+                output_name=output_name,
             )
-            self.jobs.append(job)
-            self._log_status(f"Added: {base_name}")
+            self._add_job(job)
+            self._log_status(f"Added: {output_name}")
 
+        if valid_urls:
+            self._join_running_run(window)
         window["-URLS-INPUT-"].update("")
 
     def _handle_add_files(self, window: sg.Window, values: dict) -> None:
@@ -219,18 +279,31 @@ class TranscriptionGUI:
         if errors:
             sg.popup_error("\n".join(errors))
 
-        for file_path in valid_files:
-            base_name = FileUtils.extract_base_name(file_path)
-            options = self._get_options_from_window(window)
-            options.source = file_path
+        template = self._get_options_from_window(values)
+        for file_path, output_name in zip(
+            valid_files, self._output_names(valid_files)
+        ):
             job = TranscriptionJob(
-                id=f"file-{len(self.jobs)}",
+                id=f"file-{next(self._job_ids)}",
                 source=file_path,
-                options=options,
+                options=replace(template, source=file_path),
+                output_name=output_name,
             )
-            self.jobs.append(job)
+            self._add_job(job)
             self._log_status(f"Added: {file_path.name}")
 
+        if valid_files:
+            self._join_running_run(window)
+
+    def _output_names(self, sources: list) -> list[str]:
+        """Pick output base names that no queued job is using yet.
+
+        Jobs can run concurrently, so two sources named alike (d1/x.mp3
+        and d2/x.mp3) would otherwise write the same files.
+        """
+        taken = [job.output_name for job in self.jobs if job.output_name]
+        return FileUtils.unique_base_names(sources, taken)
+
     def _handle_select_output_dir(self, window: sg.Window) -> None:
         """Handle output directory selection."""
         folder = sg.popup_get_folder("Select output directory")
@@ -244,100 +317,271 @@ class TranscriptionGUI:
         if not self.jobs:
             sg.popup_error("Add some jobs first!")
             return
+        if self.running:
+            if self._join_running_run(window):
+                self._log_status("Run in progress; pending jobs added to it")
+            return
 
         self.running = True
         self.cancel_requested = False
+        concurrency = int(values["-CONCURRENCY-"])
+        self._ensure_pool(concurrency)
 
         # Run transcription in background thread
-        thread = threading.Thread(target=self._run_transcriptions, args=(window,))
+        thread = threading.Thread(
+            target=self._run_transcriptions, args=(window, concurrency)
+        )
         thread.daemon = True
         thread.start()
 
-    def _run_transcriptions(self, window: sg.Window) -> None:
-        """Run all pending transcriptions."""
+    def _ensure_pool(self, size: int) -> None:
+        """Have a worker pool of exactly ``size`` processes ready.
+
+        An existing pool of the right size is kept, so its workers (and any
+        model they loaded) carry over between runs; otherwise it is replaced.
+        """
+        if self._pool is not None and self._pool_size == size:
+            return
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool(size)
+        self._pool_size = size
+
+    @staticmethod
+    def _terminate_pool(pool: ProcessPoolExecutor) -> None:
+        """Kill the pool's workers instead of waiting for in-flight jobs.
+
+        Used on close: a long transcription would otherwise keep the
+        process alive after the window is gone.
+        """
+        # shutdown() drops the process table, so grab it first
+        processes = list((pool._processes or {}).values())
+        for process in processes:
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _new_pool(size: int) -> ProcessPoolExecutor:
+        """Create a worker pool.
+
+        Uses "spawn": the pool is first used from the asyncio thread while
+        Tk runs on the main thread, and forking a multithreaded process is
+        unsafe.
+        """
+        return ProcessPoolExecutor(
+            max_workers=size, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _run_transcriptions(self, window: sg.Window, concurrency: int = 1) -> None:
+        """Run all pending transcriptions, up to ``concurrency`` at a time."""
         try:
-            for idx, job in enumerate(self.jobs):
-                if job.status != JobStatus.PENDING:
-                    continue
+            while True:
+                asyncio.run(self._run_pending_jobs(window, concurrency))
+                # Jobs added just as the loop wound down were handed to a
+                # loop that no longer schedules anything; run them now.
+                # Checked under the lock _join_running_run holds, so a job
+                # is either seen here or finds the run already over.
+                with self._status_lock:
+                    if self.cancel_requested or not any(
+                        job.status == JobStatus.PENDING for job in self.jobs
+                    ):
+                        self.running = False
+                        break
+        finally:
+            self.running = False
+            self._loop = None
+            self._tasks = {}
 
-                if self.cancel_requested:
-                    break
+    async def _run_pending_jobs(self, window: sg.Window, concurrency: int) -> None:
+        """Schedule every pending job on the event loop and wait for all."""
+        self._loop = asyncio.get_running_loop()
+        self._sem = asyncio.Semaphore(concurrency)
+        self._tasks = {}
+        self._schedule_pending(window)
 
-                self.current_job_index = idx
-                job.status = JobStatus.RUNNING
-                job.started_at = datetime.now()
-                self._log_status(f"Processing: {job.source_name}")
+        # Jobs added mid-run join this loop too, so wait until none are left
+        while True:
+            unfinished = [task for task in self._tasks if not task.done()]
+            if not unfinished:
+                break
+            await asyncio.wait(unfinished)
+        # From here on new jobs are left to the final check in _run_transcriptions
+        self._loop = None
 
+    def _schedule_pending(self, window: sg.Window) -> None:
+        """Start a task for each pending job not yet part of this run.
+
+        Runs on the event loop thread.
+        """
+        if self._loop is None or self.cancel_requested:
+            return
+        scheduled = {job.id for job in self._tasks.values()}
+        for job in list(self.jobs):
+            if job.status == JobStatus.PENDING and job.id not in scheduled:
+                task = asyncio.create_task(self._run_job(window, job, self._sem))
+                self._tasks[task] = job
+
+    def _join_running_run(self, window: sg.Window) -> bool:
+        """Hand newly added pending jobs to the active run, if any.
+
+        Returns:
+            True if the run will pick them up, False if there is no run to join
+        """
+        with self._status_lock:
+            if not self.running:
+                return False
+            if self.cancel_requested:
+                self._log_status("Run in progress; new jobs will start next run")
+                return False
+            loop = self._loop
+            if loop is not None:
                 try:
-                    # Perform transcription
-                    result = self.transcriber.transcribe(job.source, job.options)
-                    job.result = result
-
-                    # Save outputs
-                    base_name = FileUtils.extract_base_name(job.source)
-                    for format_name in job.options.output_formats:
-                        try:
-                            formatter = FormatterFactory.get_formatter(format_name)
-                            output = formatter.format(result)
-                            output_path = FileUtils.generate_output_path(
-                                base_name,
-                                result.language,
-                                format_name,
-                                self.output_dir,
-                            )
-                            output_path.write_text(output, encoding="utf-8")
-                            job.output_paths[format_name] = output_path
-                        except Exception as e:
-                            self._log_status(f"Error saving {format_name}: {e}")
-
-                    job.status = JobStatus.COMPLETED
-                    job.completed_at = datetime.now()
-                    self._log_status(f"[DONE] {job.source_name}")
-
-                except TranscriptionError as e:
-                    job.status = JobStatus.FAILED
-                    job.error = str(e)
-                    job.completed_at = datetime.now()
-                    self._log_status(f"[ERROR] {job.source_name}: {e}")
+                    loop.call_soon_threadsafe(self._schedule_pending, window)
+                except RuntimeError:
+                    pass  # Loop closed meanwhile; the run's final check starts them
+            return True
+
+    async def _run_job(
+        self,
+        window: sg.Window,
+        job: TranscriptionJob,
+        sem: asyncio.Semaphore,
+    ) -> None:
+        """Transcribe one job once a concurrency slot is free."""
+        async with sem:
+            if self.cancel_requested:
+                return
+
+            loop = asyncio.get_running_loop()
+            self._set_status(job, JobStatus.RUNNING)
+            job.mark_started()
+            self._log_status(f"Processing: {job.source_name}")
+            self._notify_job_changed(window, job)
+
+            pool = self._pool
+            try:
+                # Perform transcription in a worker process
+                result = await loop.run_in_executor(
+                    pool, transcribe_source, job.source, job.options
+                )
+                job.result = result
+
+                # Save outputs (file I/O, so a thread is enough)
+                await loop.run_in_executor(None, self._save_outputs, job, result)
+
+                self._set_status(job, JobStatus.COMPLETED)
+                job.mark_completed()
+                self._log_status(f"[DONE] {job.source_name}")
+                self._notify_job_changed(window, job)
+
+            except BrokenProcessPool as e:
+                # A worker died; replace the pool once so later jobs can run
+                # (unless the window closed and the workers were killed)
+                if self._pool is pool and not self._closed:
+                    self._pool = self._new_pool(self._pool_size)
+                    pool.shutdown(wait=False, cancel_futures=True)
+                self._set_status(job, JobStatus.FAILED)
+                job.error = str(e)
+                job.mark_completed()
+                self._log_status(f"[ERROR] {job.source_name}: worker crashed")
+                self._notify_job_changed(window, job)
+            except TranscriptionError as e:
+                self._set_status(job, JobStatus.FAILED)
+                job.error = str(e)
+                job.mark_completed()
+                self._log_status(f"[ERROR] {job.source_name}: {e}")
+                self._notify_job_changed(window, job)
+            except Exception as e:
+                self._set_status(job, JobStatus.FAILED)
+                job.error = str(e)
+                job.mark_completed()
+                self._log_status(f"[ERROR] {job.source_name}: {e}")
+                self._notify_job_changed(window, job)
+
+    def _save_outputs(self, job: TranscriptionJob, result: TranscriptionResult) -> None:
+        """Write every requested output format for a finished job."""
+        base_name = job.output_name or FileUtils.extract_base_name(job.source)
+
+        # One timestamp for every format, so md and json agree
+        if result.transcribed_at is None:
+            result.transcribed_at = datetime.now().isoformat()
+        with shared_render_cache(result, job.options.output_formats):
+            for format_name in job.options.output_formats:
+                try:
+                    formatter = FormatterFactory.get_formatter(format_name)
+                    output_path = FileUtils.generate_output_path(
+                        base_name,
+                        result.language,
+                        format_name,
+                        self.output_dir,
+                    )
+                    with FileUtils.open_output(output_path) as fh:
+                        formatter.write(result, fh)
+                    job.output_paths[format_name] = output_path
                 except Exception as e:
-                    job.status = JobStatus.FAILED
-                    job.error = str(e)
-                    job.completed_at = datetime.now()
-                    self._log_status(f"[ERROR] {job.source_name}: {e}")
+                    self._log_status(f"Error saving {format_name}: {e}")
 
-        finally:
-            self.running = False
-            self.current_job_index = None
+    def _add_job(self, job: TranscriptionJob) -> None:
+        """Queue a new job and count it."""
+        with self._status_lock:
+            self.jobs.append(job)
+            self._status_counts[job.status] += 1
+
+    def _set_status(self, job: TranscriptionJob, status: JobStatus) -> None:
+        """Change a job's status, keeping the per-status counts in step."""
+        with self._status_lock:
+            self._status_counts[job.status] -= 1
+            self._status_counts[status] += 1
+            job.status = status
+
+    def _notify_job_changed(self, window: sg.Window, job: TranscriptionJob) -> None:
+        """Mark a job's row dirty and wake the GUI thread to redraw it."""
+        if self._closed:
+            return
+        self._dirty_rows.add(job.id)
+        window.write_event_value("-PROGRESS-", (job.id, job.status.value))
+
+    def _cancel_waiting_jobs(self) -> None:
+        """Cancel tasks still waiting for a slot; running jobs finish normally."""
+        for task, job in self._tasks.items():
+            if job.status == JobStatus.PENDING:
+                task.cancel()
 
     def _handle_cancel(self) -> None:
         """Handle cancel request."""
         self.cancel_requested = True
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._cancel_waiting_jobs)
+            except RuntimeError:
+                pass  # Run finished and closed its loop meanwhile
         self._log_status("Cancel requested")
 
     def _handle_clear_finished(self, window: sg.Window) -> None:
         """Remove finished jobs from the list."""
-        self.jobs = [
-            job
-            for job in self.jobs
-            if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED)
-        ]
+        with self._status_lock:
+            self.jobs = [
+                job
+                for job in self.jobs
+                if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED)
+            ]
+            self._status_counts = Counter(job.status for job in self.jobs)
         self._log_status("Cleared finished jobs")
 
-    def _get_options_from_window(self, window: sg.Window) -> TranscriptionOptions:
-        """Extract options from window values."""
-        window.refresh()
-
+    def _get_options_from_window(self, values: dict) -> TranscriptionOptions:
+        """Extract options from the values returned by ``window.read()``."""
         # Collect selected formats
         formats = []
-        if window["-FORMAT-TXT-"].get():
+        if values["-FORMAT-TXT-"]:
             formats.append("txt")
-        if window["-FORMAT-MD-"].get():
+        if values["-FORMAT-MD-"]:
             formats.append("md")
-        if window["-FORMAT-SRT-"].get():
+        if values["-FORMAT-SRT-"]:
             formats.append("srt")
-        if window["-FORMAT-VTT-"].get():
+        if values["-FORMAT-VTT-"]:
             formats.append("vtt")
-        if window["-FORMAT-JSON-"].get():
+        if values["-FORMAT-JSON-"]:
             formats.append("json")
 
         if not formats:
@@ -345,45 +589,66 @@ class TranscriptionGUI:
 
         return TranscriptionOptions(
             source="temp",
-            language=window["-LANGUAGE-"].get(),
-            quality=window["-QUALITY-"].get(),
-            diarization=window["-DIARIZATION-"].get(),
-            smart_format=window["-SMART-FORMAT-"].get(),
-            timestamps=window["-TIMESTAMPS-"].get(),
+            language=values["-LANGUAGE-"],
+            quality=values["-QUALITY-"],
+            diarization=values["-DIARIZATION-"],
+            smart_format=values["-SMART-FORMAT-"],
+            timestamps=values["-TIMESTAMPS-"],
             output_formats=formats,
         )
 
+    @staticmethod
+    def _job_row(job: TranscriptionJob) -> list:
+        """Build the table row for a job."""
+        return [
+            job.source_name,
+            job.status.value,
+            job.options.language,
+            job.options.quality_value,
+        ]
+
     def _update_job_table(self, window: sg.Window) -> None:
-        """Update the job list table."""
-        rows = []
-        for job in self.jobs:
-            rows.append(
-                [
-                    job.source_name,
-                    job.status.value,
-                    job.options.language,
-                    job.options.quality.value,
-                ]
-            )
-        window["-JOBS-TABLE-"].update(values=rows)
+        """Redraw the whole job list table."""
+        self._dirty_rows.clear()
+        self._row_index = {job.id: idx for idx, job in enumerate(self.jobs)}
+        window["-JOBS-TABLE-"].update(values=[self._job_row(job) for job in self.jobs])
+
+    def _update_dirty_rows(self, window: sg.Window) -> None:
+        """Redraw only the rows of jobs that changed since the last redraw."""
+        table = window["-JOBS-TABLE-"]
+        while self._dirty_rows:
+            idx = self._row_index.get(self._dirty_rows.pop())
+            if idx is None:
+                continue  # Job was cleared from the table meanwhile
+            row = self._job_row(self.jobs[idx])
+            table.Values[idx] = row
+            table.Widget.item(table.tree_ids[idx], values=row)
 
     def _update_status_display(self, window: sg.Window) -> None:
         """Update status display."""
-        pending = sum(1 for j in self.jobs if j.status == JobStatus.PENDING)
-        running = sum(1 for j in self.jobs if j.status == JobStatus.RUNNING)
-        completed = sum(1 for j in self.jobs if j.status == JobStatus.COMPLETED)
-        failed = sum(1 for j in self.jobs if j.status == JobStatus.FAILED)
+        counts = self._status_counts
+        pending = counts[JobStatus.PENDING]
+        running = counts[JobStatus.RUNNING]
+        completed = counts[JobStatus.COMPLETED]
+        failed = counts[JobStatus.FAILED]
 
         summary = f"Jobs: {len(self.jobs)} | Pending: {pending} | Running: {running} | Done: {completed} | Failed: {failed}\n"
-        summary += "\n".join(self.status_log[-8:])
+        summary += self._log_tail_str
 
+        # Skip the Tk redraw when nothing visible changed
+        if summary == self._last_status_str:
+            return
+        self._last_status_str = summary
         window["-STATUS-"].update(summary, append=False)
 
     def _log_status(self, message: str) -> None:
         """Log status message."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.status_log.append(f"[{timestamp}] {message}")
-        self.status_log = self.status_log[-20:]
+        entry = f"[{timestamp}] {message}"
+        with self._log_lock:
+            self.status_log.append(entry)
+            self._log_tail.append(entry)
+            self._log_tail_str = "\n".join(self._log_tail)
 
 
 def run_gui() -> None:
@@ -1,42 +1,78 @@
 """File I/O utilities for handling inputs and generating output paths."""
 
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse, parse_qs
+from typing import Iterable, Optional, TextIO
+from urllib.parse import SplitResult, urlsplit, parse_qs
 import mimetypes
 
+from app.config import AppConfig
+
+
+@lru_cache(maxsize=512)
+def _split(url: str) -> SplitResult:
+    """Parse a URL once; validation and name extraction reuse the result."""
+    return urlsplit(url)
+
 
 class FileUtils:
     """Utilities for file operations."""
 
-    SAFE_FILENAME_PATTERN = re.compile(r"[^\w\-. ]", re.UNICODE)
-    MULTIPLE_DOTS = re.compile(r"\.{2,}")
-    MULTIPLE_SPACES = re.compile(r" {2,}")
-
-    SUPPORTED_AUDIO_FORMATS = {
-        ".mp3",
-        ".wav",
-        ".m4a",
-        ".flac",
-        ".ogg",
-        ".aac",
-        ".wma",
-    }
-    SUPPORTED_VIDEO_FORMATS = {
-        ".mp4",
-        ".webm",
-        ".mkv",
-        ".avi",
-        ".mov",
-        ".flv",
-        ".m4v",
-    }
+    # Unsafe characters, runs of dots and runs of spaces, matched in one
+    # pass; the matching group picks the replacement below. ASCII input uses
+    # the ASCII-compiled twin, which skips Unicode category lookups for \w.
+    SANITIZE_PATTERN = re.compile(r"([^\w\-. ])|(\.{2,})|( {2,})", re.UNICODE)
+    SANITIZE_PATTERN_ASCII = re.compile(SANITIZE_PATTERN.pattern, re.ASCII)
+    SANITIZE_REPLACEMENTS = (None, "-", ".", " ")
+    # Unsafe ASCII characters map straight to "-" without the regex engine
+    SANITIZE_ASCII_TABLE = str.maketrans(
+        {
+            c: "-"
+            for c in map(chr, range(128))
+            if not re.fullmatch(r"[\w\-. ]", c)
+        }
+    )
+    # Necessary shape of a URL with scheme and host ("scheme://host...")
+    URL_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://[^/?#]")
+    # 11-character video ID in youtu.be, watch?v=, /embed/ and /shorts/ URLs
+    YOUTUBE_ID_PATTERN = re.compile(
+        r"(?:youtu\.be/|youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|shorts/))"
+        r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+    )
+
+    SUPPORTED_AUDIO_FORMATS = frozenset(
+        {
+            ".mp3",
+            ".wav",
+            ".m4a",
+            ".flac",
+            ".ogg",
+            ".aac",
+            ".wma",
+        }
+    )
+    SUPPORTED_VIDEO_FORMATS = frozenset(
+        {
+            ".mp4",
+            ".webm",
+            ".mkv",
+            ".avi",
+            ".mov",
+            ".flv",
+            ".m4v",
+        }
+    )
+    SUPPORTED_FORMATS = SUPPORTED_AUDIO_FORMATS | SUPPORTED_VIDEO_FORMATS
 
     @classmethod
     def sanitize_filename(cls, filename: str, max_length: int = 200) -> str:
         """Sanitize filename to be safe across filesystems.
 
+        Results are memoized, since a batch sanitizes the same titles
+        repeatedly; ``FileUtils._sanitize_cached.cache_clear()`` resets them.
+
         Args:
             filename: Original filename or title
             max_length: Maximum length for the filename
@@ -44,12 +80,26 @@ class FileUtils:
         Returns:
             Safe filename
         """
-        # Remove unsafe characters
-        safe = cls.SAFE_FILENAME_PATTERN.sub("-", filename)
-        # Replace multiple dots with single
-        safe = cls.MULTIPLE_DOTS.sub(".", safe)
-        # Replace multiple spaces with single
-        safe = cls.MULTIPLE_SPACES.sub(" ", safe)
+        return cls._sanitize_cached(filename, max_length)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sanitize_cached(filename: str, max_length: int) -> str:
+        """Uncached body of sanitize_filename."""
+        # Replace unsafe ASCII characters with "-"
+        safe = filename.translate(FileUtils.SANITIZE_ASCII_TABLE)
+        # Non-ASCII unsafe characters and dot/space runs still need the regex
+        if safe.isascii():
+            pattern = (
+                FileUtils.SANITIZE_PATTERN_ASCII
+                if ".." in safe or "  " in safe
+                else None
+            )
+        else:
+            pattern = FileUtils.SANITIZE_PATTERN
+        if pattern is not None:
+            replacements = FileUtils.SANITIZE_REPLACEMENTS
+            safe = pattern.sub(lambda m: replacements[m.lastindex], safe)
         # Strip leading/trailing spaces and dots
         safe = safe.strip(" .")
         # Limit length
@@ -76,10 +126,24 @@ class FileUtils:
         Returns:
             Full output path
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
+        AppConfig.ensure_dir(output_dir)
         filename = f"{base_name}.{language}.{format}"
         return output_dir / filename
 
+    @staticmethod
+    def open_output(path: Path) -> TextIO:
+        """Open an output file from generate_output_path for writing.
+
+        generate_output_path creates each directory only once per process,
+        so if the folder was deleted since (e.g. while the GUI stays open),
+        recreate it and retry instead of failing the write.
+        """
+        try:
+            return path.open("w", encoding="utf-8", buffering=1 << 16)
+        except FileNotFoundError:
+            AppConfig.ensure_dir(path.parent, force=True)
+            return path.open("w", encoding="utf-8", buffering=1 << 16)
+
     @classmethod
     def extract_base_name(cls, source: str | Path) -> str:
         """Extract base name from file path or URL.
@@ -99,24 +163,54 @@ class FileUtils:
 
         return cls.sanitize_filename(name)
 
+    @classmethod
+    def unique_base_names(
+        cls, sources: Iterable[str | Path], taken: Iterable[str] = ()
+    ) -> list[str]:
+        """Extract base names for sources written to the same directory.
+
+        Sources whose names collide (``d1/x.mp3`` and ``d2/x.mp3``, or two
+        URL shapes of one video) get ``-2``, ``-3``... suffixes so their
+        outputs don't overwrite each other. Names compare case-insensitively
+        for case-insensitive filesystems.
+
+        Args:
+            sources: File paths or URLs
+            taken: Base names already in use, which are avoided as well
+        """
+        names = []
+        seen = {name.casefold() for name in taken}
+        for source in sources:
+            base = name = cls.extract_base_name(source)
+            count = 1
+            while name.casefold() in seen:
+                count += 1
+                name = f"{base}-{count}"
+            seen.add(name.casefold())
+            names.append(name)
+        return names
+
     @classmethod
     def _extract_from_url(cls, url: str) -> str:
         """Extract title/ID from URL.
 
         Handles YouTube, Vimeo, and generic URLs.
         """
-        # YouTube
+        # YouTube: the common URL shapes carry an 11-character video ID
+        match = cls.YOUTUBE_ID_PATTERN.search(url)
+        if match:
+            return match.group(1)
         if "youtube.com" in url or "youtu.be" in url:
             # Try to get video ID
             if "youtu.be/" in url:
                 video_id = url.split("youtu.be/")[-1].split("?")[0]
             else:
-                parsed = parse_qs(urlparse(url).query)
+                parsed = parse_qs(_split(url).query)
                 video_id = parsed.get("v", [""])[0]
             return video_id or "youtube-video"
 
         # Generic URL: extract domain and path
-        parsed = urlparse(url)
+        parsed = _split(url)
         domain = parsed.netloc.replace("www.", "")
         path = parsed.path.strip("/").split("/")[-1]
         return path or domain or "recording"
@@ -124,17 +218,20 @@ class FileUtils:
     @classmethod
     def is_valid_file(cls, path: Path) -> bool:
         """Check if file is a supported audio or video format."""
-        suffix = path.suffix.lower()
-        return suffix in (cls.SUPPORTED_AUDIO_FORMATS | cls.SUPPORTED_VIDEO_FORMATS)
+        return path.suffix.lower() in cls.SUPPORTED_FORMATS
 
     @classmethod
     def is_valid_url(cls, url: str) -> bool:
         """Basic URL validation."""
+        # Reject pasted garbage without running the regex or the parser
+        if "://" not in url or not cls.URL_PATTERN.match(url):
+            return False
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
+            result = _split(url)
+        except ValueError:
+            # urlsplit rejects e.g. malformed IPv6 hosts ("http://[::1")
             return False
+        return bool(result.scheme and result.netloc)
 
 
 class InputValidator:
@@ -152,15 +249,19 @@ class InputValidator:
         """
         valid = []
         errors = []
+        # Bound once; these run for every pasted line
+        is_valid_url = FileUtils.is_valid_url
+        add_valid = valid.append
+        add_error = errors.append
 
-        for line in urls.strip().split("\n"):
+        for line in urls.splitlines():
             url = line.strip()
             if not url:
                 continue
-            if FileUtils.is_valid_url(url):
-                valid.append(url)
+            if is_valid_url(url):
+                add_valid(url)
             else:
-                errors.append(f"Invalid URL: {url}")
+                add_error(f"Invalid URL: {url}")
 
         return valid, errors
 
@@ -176,15 +277,25 @@ class InputValidator:
         """
         valid = []
         errors = []
+        supported = FileUtils.SUPPORTED_FORMATS
+        add_valid = valid.append
+        add_error = errors.append
 
         for path in paths:
-            if not path.exists():
-                errors.append(f"File not found: {path}")
-            elif not path.is_file():
-                errors.append(f"Not a file: {path}")
-            elif not FileUtils.is_valid_file(path):
-                errors.append(f"Unsupported format: {path.suffix}")
+            # One stat answers both "exists" and "is a regular file"
+            try:
+                mode = path.stat().st_mode
+            except OSError:
+                add_error(f"File not found: {path}")
+                continue
+
+            if not stat.S_ISREG(mode):
+                add_error(f"Not a file: {path}")
+                continue
+            suffix = path.suffix
+            if suffix.lower() in supported:
+                add_valid(path)
             else:
-                valid.append(path)
+                add_error(f"Unsupported format: {suffix}")
 
         return valid, errors
@@ -1,11 +1,16 @@
-"""Data models for transcription jobs and results."""
+"""Data models for transcription jobs and results.
 
+Plain dataclasses, so importing them (and starting the CLI) doesn't pull
+in pydantic; validation of untrusted provider payloads lives in
+``app.models_api``.
+"""
+
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from datetime import datetime
-from pydantic import BaseModel, Field
 
 
 class JobStatus(str, Enum):
@@ -34,53 +39,125 @@ class TimestampLevel(str, Enum):
     UTTERANCE = "utterance"
 
 
-class TranscriptionOptions(BaseModel):
-    """Options for a transcription job."""
-
-    source: str | Path = Field(..., description="URL or file path")
-    language: str = Field(default="auto", description="Language code")
-    quality: QualityPreset = Field(
-        default=QualityPreset.BALANCED, description="Quality preset"
-    )
-    diarization: bool = Field(
-        default=False, description="Enable speaker diarization if supported"
-    )
-    smart_format: bool = Field(
-        default=True, description="Apply smart punctuation and formatting"
-    )
-    timestamps: TimestampLevel = Field(
-        default=TimestampLevel.UTTERANCE, description="Timestamp granularity"
-    )
-    output_formats: List[str] = Field(
-        default=["txt", "srt"], description="Output formats to generate"
-    )
-
-    class Config:
-        use_enum_values = False
+@dataclass
+class TranscriptionOptions:
+    """Options for a transcription job.
+
+    ``quality`` and ``timestamps`` also accept their string values (as
+    the GUI combos and CLI choices provide) and are coerced to the enums.
+    Use ``dataclasses.replace`` to derive per-source copies.
+    """
+
+    source: str | Path  # URL or file path
+    language: str = "auto"  # Language code
+    quality: QualityPreset = QualityPreset.BALANCED  # Quality preset
+    diarization: bool = False  # Enable speaker diarization if supported
+    smart_format: bool = True  # Apply smart punctuation and formatting
+    timestamps: TimestampLevel = TimestampLevel.UTTERANCE  # Timestamp granularity
+    output_formats: List[str] = field(
+        default_factory=lambda: ["txt", "srt"]
+    )  # Output formats to generate
+    # Plain string value of ``quality``, resolved once
+    quality_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.quality = QualityPreset(self.quality)
+        self.timestamps = TimestampLevel(self.timestamps)
+        self.quality_value = self.quality.value
+
+
+@dataclass(slots=True, frozen=True)
+class Segment:
+    """A single transcript segment with timing.
+
+    Slotted and frozen, since transcripts hold thousands of these.
+    Providers convert API payloads with ``from_api``.
+    """
+
+    start_time: float  # Start time in seconds
+    end_time: float  # End time in seconds
+    text: str  # Transcript text
+    speaker: Optional[str] = None  # Speaker ID if diarization enabled
+    confidence: Optional[float] = None  # Confidence score (0.0-1.0) if available
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Segment":
+        """Build a segment from a provider payload.
+
+        Accepts ``start``/``end`` with ``text`` or ``transcript`` keys (the
+        JSON output shape and Deepgram utterances alike).
+        """
+        speaker = data.get("speaker")
+        confidence = data.get("confidence")
+        return cls(
+            start_time=float(data["start"]),
+            end_time=float(data["end"]),
+            text=str(data.get("text", data.get("transcript", ""))),
+            speaker=None if speaker is None else str(speaker),
+            confidence=None if confidence is None else float(confidence),
+        )
 
 
-class Segment(BaseModel):
-    """A single transcript segment with timing."""
+@dataclass
+class TranscriptionResult:
+    """Result of a transcription job."""
 
-    start_time: float = Field(..., description="Start time in seconds")
-    end_time: float = Field(..., description="End time in seconds")
-    text: str = Field(..., description="Transcript text")
-    speaker: Optional[str] = Field(None, description="Speaker ID if diarization enabled")
-    confidence: Optional[float] = Field(
-        None, description="Confidence score (0.0-1.0) if available"
+    text: str  # Full transcript text
+    language: str  # Detected or requested language
+    segments: List[Segment]  # Segments with timestamps
+    duration: float  # Total duration in seconds
+    raw_response: Optional[Dict[str, Any]] = None  # Raw API response for debugging
+    # ISO timestamp shared by all outputs of this result
+    transcribed_at: Optional[str] = None
+
+    # Per-segment render data shared while writing several formats
+    # (see formats.shared_render_cache); None outside that window
+    _format_cache: Optional[list] = field(
+        default=None, init=False, repr=False, compare=False
     )
 
 
-class TranscriptionResult(BaseModel):
-    """Result of a transcription job."""
-
-    text: str = Field(..., description="Full transcript text")
-    language: str = Field(..., description="Detected or requested language")
-    segments: List[Segment] = Field(..., description="Segments with timestamps")
-    duration: float = Field(..., description="Total duration in seconds")
-    raw_response: Optional[Dict[str, Any]] = Field(
-        None, description="Raw API response for debugging"
-    )
+@dataclass
+class TranscriptionResultStream:
+    """A transcription result whose segments arrive lazily.
+
+    ``segments`` can be iterated once, e.g. by a formatter writing straight
+    to disk, so a long transcript never has to sit in memory as a list.
+    When the provider can't supply ``duration`` up front, it is filled in
+    from the segments once they have all been consumed.
+    """
+
+    text: str
+    language: str
+    segments: Iterable[Segment]
+    duration: Optional[float] = None
+    raw_response: Optional[Dict[str, Any]] = None
+    transcribed_at: Optional[str] = None
+    _last_end: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        self.segments = self._track(iter(self.segments))
+
+    def _track(self, segments: Iterator[Segment]) -> Iterator[Segment]:
+        """Yield segments, keeping a running end time for ``duration``."""
+        for segment in segments:
+            if segment.end_time > self._last_end:
+                self._last_end = segment.end_time
+            yield segment
+        if self.duration is None:
+            self.duration = self._last_end
+
+    def materialize(self) -> TranscriptionResult:
+        """Consume the remaining segments into a TranscriptionResult."""
+        segments = list(self.segments)
+        return TranscriptionResult(
+            text=self.text,
+            language=self.language,
+            segments=segments,
+            duration=self.duration,
+            raw_response=self.raw_response,
+            transcribed_at=self.transcribed_at,
+        )
 
 
 @dataclass
@@ -94,9 +171,27 @@ class TranscriptionJob:
     result: Optional[TranscriptionResult] = None
     error: Optional[str] = None
     output_paths: Dict[str, Path] = field(default_factory=dict)  # format -> path
+    output_name: Optional[str] = None  # base name of the output files
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    # Monotonic clock readings behind elapsed_time; the datetimes are for display
+    _started_monotonic: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _completed_monotonic: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def mark_started(self) -> None:
+        """Record the start of processing."""
+        self._started_monotonic = time.monotonic()
+        self.started_at = datetime.now()
+
+    def mark_completed(self) -> None:
+        """Record the end of processing (success or failure)."""
+        self._completed_monotonic = time.monotonic()
+        self.completed_at = datetime.now()
 
     @property
     def source_name(self) -> str:
@@ -108,7 +203,9 @@ class TranscriptionJob:
     @property
     def elapsed_time(self) -> Optional[float]:
         """Get elapsed time in seconds, if job has started."""
-        if not self.started_at:
+        if self._started_monotonic is None:
             return None
-        end = self.completed_at or datetime.now()
-        return (end - self.started_at).total_seconds()
+        end = self._completed_monotonic
+        if end is None:
+            end = time.monotonic()
+        return end - self._started_monotonic
@@ -0,0 +1,35 @@
+"""Pydantic validation for data crossing the provider API boundary.
+
+The models in ``app.models`` are plain dataclasses and trust their inputs.
+Providers parsing untrusted JSON should go through these adapters, which
+enforce required fields and coerce types the way the old pydantic models
+did. Importing this module loads pydantic, so only providers should
+import it; the CLI and GUI don't.
+"""
+
+from typing import Any, List
+from pydantic import TypeAdapter
+from app.models import Segment, TranscriptionOptions, TranscriptionResult
+
+SegmentAdapter = TypeAdapter(Segment)
+SegmentListAdapter = TypeAdapter(List[Segment])
+TranscriptionOptionsAdapter = TypeAdapter(TranscriptionOptions)
+TranscriptionResultAdapter = TypeAdapter(TranscriptionResult)
+
+
+def parse_segments(data: Any) -> List[Segment]:
+    """Validate a list of segment dicts (``start_time``, ``end_time``, ...).
+
+    Raises:
+        pydantic.ValidationError: If a segment is missing or mistyped
+    """
+    return SegmentListAdapter.validate_python(data)
+
+
+def parse_result(data: Any) -> TranscriptionResult:
+    """Validate a full result dict, including its segments.
+
+    Raises:
+        pydantic.ValidationError: If the payload doesn't match the model
+    """
+    return TranscriptionResultAdapter.validate_python(data)
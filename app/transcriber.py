@@ -11,18 +11,26 @@ TODO: Integrate with:
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterator, List, Sequence
 import json
+import re
 import time
 from app.models import (
     TranscriptionOptions,
     TranscriptionResult,
+    TranscriptionResultStream,
     Segment,
     QualityPreset,
     TimestampLevel,
 )
-from app.config import APIConfig
+from app.config import APIConfig, AppConfig
+
+# A sentence: text up to and including its terminating punctuation
+_SENTENCE_RE = re.compile(r"\s*([^.!?]+[.!?]?)")
 
 
 class BaseTranscriber(ABC):
@@ -46,6 +54,55 @@ class BaseTranscriber(ABC):
         """
         pass
 
+    def transcribe_stream(
+        self, source: str | Path, options: TranscriptionOptions
+    ) -> TranscriptionResultStream:
+        """Transcribe a source, handing segments over as they are produced.
+
+        Providers that receive segments incrementally (streaming APIs,
+        chunked uploads) should override this. The default wraps
+        ``transcribe``, so every provider supports it.
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        result = self.transcribe(source, options)
+        return TranscriptionResultStream(
+            text=result.text,
+            language=result.language,
+            segments=result.segments,
+            duration=result.duration,
+            raw_response=result.raw_response,
+            transcribed_at=result.transcribed_at,
+        )
+
+    def transcribe_many(
+        self, sources: Sequence[str | Path], options: TranscriptionOptions
+    ) -> List[TranscriptionResult | Exception]:
+        """Transcribe several sources that share the same options.
+
+        Providers with a batch endpoint (or an async client) should
+        override this to amortize connection setup across the batch. The
+        default transcribes one source at a time.
+
+        Args:
+            sources: URLs or file paths
+            options: Transcription options (``source`` is set per item)
+
+        Returns:
+            One entry per source, in input order: the TranscriptionResult,
+            or the exception raised for that source
+        """
+        results: List[TranscriptionResult | Exception] = []
+        for source in sources:
+            try:
+                results.append(
+                    self.transcribe(source, replace(options, source=source))
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
 
 class MockTranscriber(BaseTranscriber):
     """Mock transcriber for development and testing.
@@ -67,13 +124,20 @@ class MockTranscriber(BaseTranscriber):
             "La précision des systèmes modernes de reconnaissance vocale est impressionnante.",
         ],
     }
+    _DUMMY_JOINED = {
+        lang: " ".join(transcripts) for lang, transcripts in DUMMY_TRANSCRIPTS.items()
+    }
+
+    def __init__(self, latency: Optional[float] = None):
+        """Initialize with a simulated latency (defaults to APIConfig.MOCK_LATENCY)."""
+        self.latency = APIConfig.MOCK_LATENCY if latency is None else latency
 
     def transcribe(
         self, source: str | Path, options: TranscriptionOptions
     ) -> TranscriptionResult:
         """Generate mock transcription result."""
         # Simulate processing time
-        time.sleep(0.5)
+        self._simulate_latency()
 
         # Get source name
         if isinstance(source, Path):
@@ -82,14 +146,11 @@ class MockTranscriber(BaseTranscriber):
             source_name = source[:30]
 
         # Select language
-        lang = options.language if options.language != "auto" else "en"
-        
-        # Get dummy text
-        transcripts = self.DUMMY_TRANSCRIPTS.get(lang, self.DUMMY_TRANSCRIPTS["en"])
-        full_text = " ".join(transcripts)
+        lang, text_lang = self._select_language(options)
 
-        # Generate segments with timestamps
-        segments = self._generate_segments(full_text, lang, options)
+        # Get dummy text and its segments, built once per language
+        full_text = self._DUMMY_JOINED[text_lang]
+        segments = list(self._segments_for(text_lang))
 
         # Calculate total duration
         duration = segments[-1].end_time if segments else 0.0
@@ -99,24 +160,60 @@ class MockTranscriber(BaseTranscriber):
             language=lang,
             segments=segments,
             duration=duration,
-            raw_response={
-                "provider": "mock",
-                "source": str(source),
-                "quality": options.quality.value,
-            },
+            raw_response=self._raw_response(source, options),
+        )
+
+    def transcribe_stream(
+        self, source: str | Path, options: TranscriptionOptions
+    ) -> TranscriptionResultStream:
+        """Stream the mock transcript's segments without listing them."""
+        self._simulate_latency()
+        lang, text_lang = self._select_language(options)
+        segments = self._segments_for(text_lang)
+        return TranscriptionResultStream(
+            text=self._DUMMY_JOINED[text_lang],
+            language=lang,
+            segments=segments,
+            duration=segments[-1].end_time if segments else 0.0,
+            raw_response=self._raw_response(source, options),
         )
 
+    def _simulate_latency(self) -> None:
+        """Sleep for the configured mock latency."""
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def _select_language(self, options: TranscriptionOptions) -> tuple[str, str]:
+        """Return (reported language, language of the dummy text used)."""
+        lang = options.language if options.language != "auto" else "en"
+        return lang, lang if lang in self._DUMMY_JOINED else "en"
+
+    @staticmethod
+    def _raw_response(
+        source: str | Path, options: TranscriptionOptions
+    ) -> Dict[str, Any]:
+        """Fake provider payload recorded on each result."""
+        return {
+            "provider": "mock",
+            "source": str(source),
+            "quality": options.quality_value,
+        }
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _segments_for(cls, lang: str) -> tuple[Segment, ...]:
+        """Segments of a language's dummy transcript (constant, so cached)."""
+        return tuple(cls._generate_segments(cls._DUMMY_JOINED[lang], lang, None))
+
     @staticmethod
     def _generate_segments(
         text: str, language: str, options: TranscriptionOptions
-    ) -> list[Segment]:
-        """Generate segments from full text."""
-        segments = []
-        sentences = text.replace(".", ".|!").split("|")
+    ) -> Iterator[Segment]:
+        """Generate segments from full text, one sentence at a time."""
         start_time = 0.0
 
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group(1).strip()
             if not sentence:
                 continue
 
@@ -132,11 +229,9 @@ class MockTranscriber(BaseTranscriber):
                 speaker=None,
                 confidence=0.95,
             )
-            segments.append(segment)
+            yield segment
             start_time = end_time
 
-        return segments
-
 
 class DeepgramTranscriber(BaseTranscriber):
     """Deepgram API transcriber.
@@ -194,6 +289,27 @@ class DeepgramTranscriber(BaseTranscriber):
         # segments = [...]
         # return TranscriptionResult(...)
 
+    def transcribe_many(
+        self, sources: Sequence[str | Path], options: TranscriptionOptions
+    ) -> List[TranscriptionResult | Exception]:
+        """Transcribe a batch with one request in flight per source.
+
+        The pre-recorded endpoint takes one file per request, so the batch
+        is fanned out over threads; each call just waits on the network.
+        """
+        if len(sources) <= 1:
+            return super().transcribe_many(sources, options)
+
+        def transcribe_one(source: str | Path) -> TranscriptionResult | Exception:
+            try:
+                return self.transcribe(source, replace(options, source=source))
+            except Exception as e:
+                return e
+
+        workers = min(len(sources), AppConfig.MAX_BATCH_SIZE)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(transcribe_one, sources))
+
 
 class WhisperTranscriber(BaseTranscriber):
     """OpenAI Whisper API transcriber.
@@ -247,26 +363,66 @@ class WhisperTranscriber(BaseTranscriber):
 class TranscriberFactory:
     """Factory for creating transcriber instances."""
 
+    # Provider name -> zero-argument constructor; API keys are read when a
+    # transcriber is first built, not at import time
+    PROVIDERS: Dict[str, Callable[[], BaseTranscriber]] = {
+        "mock": lambda: MockTranscriber(),
+        "deepgram": lambda: DeepgramTranscriber(APIConfig.DEEPGRAM_API_KEY),
+        "whisper": lambda: WhisperTranscriber(APIConfig.OPENAI_API_KEY),
+    }
+
     @staticmethod
     def create(provider: Optional[str] = None) -> BaseTranscriber:
         """Create transcriber based on configuration.
 
+        Instances are cached per provider, so repeated calls (one per job
+        in a GUI worker process, for example) reuse the same transcriber
+        and whatever model it has loaded. Transcribers must therefore be
+        safe to share between threads.
+
         Args:
             provider: Provider name (mock, deepgram, whisper). Uses config if None.
 
         Returns:
             BaseTranscriber instance
         """
-        provider = provider or APIConfig.PROVIDER
-
-        if provider == "mock":
-            return MockTranscriber()
-        elif provider == "deepgram":
-            return DeepgramTranscriber(APIConfig.DEEPGRAM_API_KEY)
-        elif provider == "whisper":
-            return WhisperTranscriber(APIConfig.OPENAI_API_KEY)
-        else:
-            raise ValueError(f"Unknown transcriber provider: {provider}")
+        return TranscriberFactory._create_cached(provider or APIConfig.PROVIDER)
+
+    @classmethod
+    def register(cls, name: str, factory: Callable[[], BaseTranscriber]) -> None:
+        """Register (or replace) a provider.
+
+        GUI jobs run in worker processes, so register at import time of a
+        module those processes also import, not from a running GUI.
+
+        Args:
+            name: Provider name, as used in TRANSCRIBER_PROVIDER
+            factory: Zero-argument callable returning a transcriber
+        """
+        cls.PROVIDERS[name] = factory
+        # Drop any instance cached under the old registration
+        cls._create_cached.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _create_cached(provider: str) -> BaseTranscriber:
+        """Build a transcriber for an already-resolved provider name."""
+        try:
+            factory = TranscriberFactory.PROVIDERS[provider]
+        except KeyError:
+            raise ValueError(f"Unknown transcriber provider: {provider}") from None
+        return factory()
+
+
+def transcribe_source(
+    source: str | Path, options: TranscriptionOptions, provider: Optional[str] = None
+) -> TranscriptionResult:
+    """Transcribe one source with a provider's transcriber.
+
+    A module-level function so it can be pickled and submitted to a
+    ProcessPoolExecutor; each worker process builds its own transcriber.
+    """
+    return TranscriberFactory.create(provider).transcribe(source, options)
 
 
 class TranscriptionError(Exception):